@@ -11,18 +11,25 @@ Usage:
 
 from __future__ import annotations
 
+import base64
+import json
 import os
 import sqlite3
 import random
 import string
 import math
-from contextlib import asynccontextmanager
+import queue
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from functools import lru_cache
+from itertools import cycle, islice
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterator, NamedTuple, Optional
 
-from fastapi import FastAPI, HTTPException, Query
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+import orjson
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 
@@ -38,133 +45,286 @@ DB_PATH = BASE_DIR / "demo_library.db"
 # Demo data — 55 realistic albums across genres
 # ---------------------------------------------------------------------------
 
-DEMO_ALBUMS = [
+class DemoAlbum(NamedTuple):
+    title: str
+    artist: str
+    year: int
+    genre: str
+    label: str
+    tracks: int
+    format: str
+    bitrate: int
+
+
+DEMO_ALBUMS = (
     # Rock
-    {"title": "Abbey Road", "artist": "The Beatles", "year": 1969, "genre": "Rock", "label": "Apple Records", "tracks": 17, "format": "FLAC", "bitrate": 1411},
-    {"title": "Dark Side of the Moon", "artist": "Pink Floyd", "year": 1973, "genre": "Rock", "label": "Harvest Records", "tracks": 10, "format": "FLAC", "bitrate": 1411},
-    {"title": "Led Zeppelin IV", "artist": "Led Zeppelin", "year": 1971, "genre": "Rock", "label": "Atlantic Records", "tracks": 8, "format": "FLAC", "bitrate": 1411},
-    {"title": "Rumours", "artist": "Fleetwood Mac", "year": 1977, "genre": "Rock", "label": "Warner Bros.", "tracks": 11, "format": "MP3", "bitrate": 320},
-    {"title": "Born to Run", "artist": "Bruce Springsteen", "year": 1975, "genre": "Rock", "label": "Columbia", "tracks": 8, "format": "FLAC", "bitrate": 1411},
-    {"title": "Nevermind", "artist": "Nirvana", "year": 1991, "genre": "Grunge", "label": "DGC Records", "tracks": 13, "format": "MP3", "bitrate": 320},
-    {"title": "OK Computer", "artist": "Radiohead", "year": 1997, "genre": "Art Rock", "label": "Parlophone", "tracks": 12, "format": "FLAC", "bitrate": 1411},
-    {"title": "Appetite for Destruction", "artist": "Guns N' Roses", "year": 1987, "genre": "Hard Rock", "label": "Geffen Records", "tracks": 12, "format": "MP3", "bitrate": 320},
-    {"title": "The Joshua Tree", "artist": "U2", "year": 1987, "genre": "Rock", "label": "Island Records", "tracks": 11, "format": "FLAC", "bitrate": 1411},
-    {"title": "Paranoid", "artist": "Black Sabbath", "year": 1970, "genre": "Heavy Metal", "label": "Vertigo", "tracks": 8, "format": "FLAC", "bitrate": 1411},
+    DemoAlbum("Abbey Road", "The Beatles", 1969, "Rock", "Apple Records", 17, "FLAC", 1411),
+    DemoAlbum("Dark Side of the Moon", "Pink Floyd", 1973, "Rock", "Harvest Records", 10, "FLAC", 1411),
+    DemoAlbum("Led Zeppelin IV", "Led Zeppelin", 1971, "Rock", "Atlantic Records", 8, "FLAC", 1411),
+    DemoAlbum("Rumours", "Fleetwood Mac", 1977, "Rock", "Warner Bros.", 11, "MP3", 320),
+    DemoAlbum("Born to Run", "Bruce Springsteen", 1975, "Rock", "Columbia", 8, "FLAC", 1411),
+    DemoAlbum("Nevermind", "Nirvana", 1991, "Grunge", "DGC Records", 13, "MP3", 320),
+    DemoAlbum("OK Computer", "Radiohead", 1997, "Art Rock", "Parlophone", 12, "FLAC", 1411),
+    DemoAlbum("Appetite for Destruction", "Guns N' Roses", 1987, "Hard Rock", "Geffen Records", 12, "MP3", 320),
+    DemoAlbum("The Joshua Tree", "U2", 1987, "Rock", "Island Records", 11, "FLAC", 1411),
+    DemoAlbum("Paranoid", "Black Sabbath", 1970, "Heavy Metal", "Vertigo", 8, "FLAC", 1411),
     # Electronic / Dance
-    {"title": "Random Access Memories", "artist": "Daft Punk", "year": 2013, "genre": "Electronic", "label": "Columbia", "tracks": 13, "format": "FLAC", "bitrate": 1411},
-    {"title": "Discovery", "artist": "Daft Punk", "year": 2001, "genre": "Electronic", "label": "Virgin", "tracks": 14, "format": "MP3", "bitrate": 320},
-    {"title": "Selected Ambient Works 85–92", "artist": "Aphex Twin", "year": 1992, "genre": "Ambient", "label": "Apollo", "tracks": 13, "format": "FLAC", "bitrate": 1411},
-    {"title": "Music Has the Right to Children", "artist": "Boards of Canada", "year": 1998, "genre": "IDM", "label": "Warp Records", "tracks": 18, "format": "FLAC", "bitrate": 1411},
-    {"title": "Homework", "artist": "Daft Punk", "year": 1997, "genre": "House", "label": "Virgin", "tracks": 16, "format": "MP3", "bitrate": 320},
-    {"title": "Since I Left You", "artist": "The Avalanches", "year": 2000, "genre": "Electronic", "label": "Modular", "tracks": 18, "format": "MP3", "bitrate": 320},
-    {"title": "Untrue", "artist": "Burial", "year": 2007, "genre": "UK Garage", "label": "Hyperdub", "tracks": 13, "format": "FLAC", "bitrate": 1411},
+    DemoAlbum("Random Access Memories", "Daft Punk", 2013, "Electronic", "Columbia", 13, "FLAC", 1411),
+    DemoAlbum("Discovery", "Daft Punk", 2001, "Electronic", "Virgin", 14, "MP3", 320),
+    DemoAlbum("Selected Ambient Works 85–92", "Aphex Twin", 1992, "Ambient", "Apollo", 13, "FLAC", 1411),
+    DemoAlbum("Music Has the Right to Children", "Boards of Canada", 1998, "IDM", "Warp Records", 18, "FLAC", 1411),
+    DemoAlbum("Homework", "Daft Punk", 1997, "House", "Virgin", 16, "MP3", 320),
+    DemoAlbum("Since I Left You", "The Avalanches", 2000, "Electronic", "Modular", 18, "MP3", 320),
+    DemoAlbum("Untrue", "Burial", 2007, "UK Garage", "Hyperdub", 13, "FLAC", 1411),
     # Hip-Hop
-    {"title": "Illmatic", "artist": "Nas", "year": 1994, "genre": "Hip-Hop", "label": "Columbia", "tracks": 10, "format": "MP3", "bitrate": 320},
-    {"title": "To Pimp a Butterfly", "artist": "Kendrick Lamar", "year": 2015, "genre": "Hip-Hop", "label": "Aftermath", "tracks": 16, "format": "FLAC", "bitrate": 1411},
-    {"title": "The Chronic", "artist": "Dr. Dre", "year": 1992, "genre": "Hip-Hop", "label": "Death Row", "tracks": 16, "format": "MP3", "bitrate": 320},
-    {"title": "Ready to Die", "artist": "The Notorious B.I.G.", "year": 1994, "genre": "Hip-Hop", "label": "Bad Boy", "tracks": 17, "format": "MP3", "bitrate": 320},
-    {"title": "Madvillainy", "artist": "Madvillain", "year": 2004, "genre": "Hip-Hop", "label": "Stones Throw", "tracks": 22, "format": "FLAC", "bitrate": 1411},
-    {"title": "Aquemini", "artist": "OutKast", "year": 1998, "genre": "Hip-Hop", "label": "LaFace", "tracks": 16, "format": "MP3", "bitrate": 320},
-    {"title": "My Beautiful Dark Twisted Fantasy", "artist": "Kanye West", "year": 2010, "genre": "Hip-Hop", "label": "Roc-A-Fella", "tracks": 13, "format": "FLAC", "bitrate": 1411},
+    DemoAlbum("Illmatic", "Nas", 1994, "Hip-Hop", "Columbia", 10, "MP3", 320),
+    DemoAlbum("To Pimp a Butterfly", "Kendrick Lamar", 2015, "Hip-Hop", "Aftermath", 16, "FLAC", 1411),
+    DemoAlbum("The Chronic", "Dr. Dre", 1992, "Hip-Hop", "Death Row", 16, "MP3", 320),
+    DemoAlbum("Ready to Die", "The Notorious B.I.G.", 1994, "Hip-Hop", "Bad Boy", 17, "MP3", 320),
+    DemoAlbum("Madvillainy", "Madvillain", 2004, "Hip-Hop", "Stones Throw", 22, "FLAC", 1411),
+    DemoAlbum("Aquemini", "OutKast", 1998, "Hip-Hop", "LaFace", 16, "MP3", 320),
+    DemoAlbum("My Beautiful Dark Twisted Fantasy", "Kanye West", 2010, "Hip-Hop", "Roc-A-Fella", 13, "FLAC", 1411),
     # Jazz
-    {"title": "Kind of Blue", "artist": "Miles Davis", "year": 1959, "genre": "Jazz", "label": "Columbia", "tracks": 5, "format": "FLAC", "bitrate": 1411},
-    {"title": "A Love Supreme", "artist": "John Coltrane", "year": 1965, "genre": "Jazz", "label": "Impulse!", "tracks": 4, "format": "FLAC", "bitrate": 1411},
-    {"title": "Time Out", "artist": "Dave Brubeck Quartet", "year": 1959, "genre": "Jazz", "label": "Columbia", "tracks": 7, "format": "FLAC", "bitrate": 1411},
-    {"title": "Bitches Brew", "artist": "Miles Davis", "year": 1970, "genre": "Jazz Fusion", "label": "Columbia", "tracks": 6, "format": "FLAC", "bitrate": 1411},
-    {"title": "Mingus Ah Um", "artist": "Charles Mingus", "year": 1959, "genre": "Jazz", "label": "Columbia", "tracks": 9, "format": "FLAC", "bitrate": 1411},
+    DemoAlbum("Kind of Blue", "Miles Davis", 1959, "Jazz", "Columbia", 5, "FLAC", 1411),
+    DemoAlbum("A Love Supreme", "John Coltrane", 1965, "Jazz", "Impulse!", 4, "FLAC", 1411),
+    DemoAlbum("Time Out", "Dave Brubeck Quartet", 1959, "Jazz", "Columbia", 7, "FLAC", 1411),
+    DemoAlbum("Bitches Brew", "Miles Davis", 1970, "Jazz Fusion", "Columbia", 6, "FLAC", 1411),
+    DemoAlbum("Mingus Ah Um", "Charles Mingus", 1959, "Jazz", "Columbia", 9, "FLAC", 1411),
     # Classical
-    {"title": "The Well-Tempered Clavier", "artist": "Glenn Gould", "year": 1963, "genre": "Classical", "label": "Columbia Masterworks", "tracks": 48, "format": "FLAC", "bitrate": 1411},
-    {"title": "Goldberg Variations", "artist": "Glenn Gould", "year": 1981, "genre": "Classical", "label": "CBS Masterworks", "tracks": 32, "format": "FLAC", "bitrate": 1411},
+    DemoAlbum("The Well-Tempered Clavier", "Glenn Gould", 1963, "Classical", "Columbia Masterworks", 48, "FLAC", 1411),
+    DemoAlbum("Goldberg Variations", "Glenn Gould", 1981, "Classical", "CBS Masterworks", 32, "FLAC", 1411),
     # R&B / Soul
-    {"title": "What's Going On", "artist": "Marvin Gaye", "year": 1971, "genre": "Soul", "label": "Tamla", "tracks": 9, "format": "FLAC", "bitrate": 1411},
-    {"title": "Songs in the Key of Life", "artist": "Stevie Wonder", "year": 1976, "genre": "R&B", "label": "Tamla", "tracks": 21, "format": "FLAC", "bitrate": 1411},
-    {"title": "Purple Rain", "artist": "Prince", "year": 1984, "genre": "R&B", "label": "Warner Bros.", "tracks": 9, "format": "MP3", "bitrate": 320},
-    {"title": "Lemonade", "artist": "Beyoncé", "year": 2016, "genre": "R&B", "label": "Columbia", "tracks": 12, "format": "FLAC", "bitrate": 1411},
-    {"title": "I Never Loved a Man the Way I Love You", "artist": "Aretha Franklin", "year": 1967, "genre": "Soul", "label": "Atlantic", "tracks": 11, "format": "FLAC", "bitrate": 1411},
+    DemoAlbum("What's Going On", "Marvin Gaye", 1971, "Soul", "Tamla", 9, "FLAC", 1411),
+    DemoAlbum("Songs in the Key of Life", "Stevie Wonder", 1976, "R&B", "Tamla", 21, "FLAC", 1411),
+    DemoAlbum("Purple Rain", "Prince", 1984, "R&B", "Warner Bros.", 9, "MP3", 320),
+    DemoAlbum("Lemonade", "Beyoncé", 2016, "R&B", "Columbia", 12, "FLAC", 1411),
+    DemoAlbum("I Never Loved a Man the Way I Love You", "Aretha Franklin", 1967, "Soul", "Atlantic", 11, "FLAC", 1411),
     # Indie / Alternative
-    {"title": "In the Aeroplane Over the Sea", "artist": "Neutral Milk Hotel", "year": 1998, "genre": "Indie Folk", "label": "Merge Records", "tracks": 11, "format": "FLAC", "bitrate": 1411},
-    {"title": "Funeral", "artist": "Arcade Fire", "year": 2004, "genre": "Indie Rock", "label": "Merge Records", "tracks": 10, "format": "MP3", "bitrate": 320},
-    {"title": "Is This It", "artist": "The Strokes", "year": 2001, "genre": "Indie Rock", "label": "RCA", "tracks": 11, "format": "MP3", "bitrate": 320},
-    {"title": "Kid A", "artist": "Radiohead", "year": 2000, "genre": "Art Rock", "label": "Parlophone", "tracks": 10, "format": "FLAC", "bitrate": 1411},
-    {"title": "Yankee Hotel Foxtrot", "artist": "Wilco", "year": 2002, "genre": "Alt-Country", "label": "Nonesuch", "tracks": 11, "format": "FLAC", "bitrate": 1411},
-    {"title": "Loveless", "artist": "My Bloody Valentine", "year": 1991, "genre": "Shoegaze", "label": "Creation Records", "tracks": 11, "format": "FLAC", "bitrate": 1411},
-    {"title": "Blue", "artist": "Joni Mitchell", "year": 1971, "genre": "Folk", "label": "Reprise Records", "tracks": 10, "format": "FLAC", "bitrate": 1411},
+    DemoAlbum("In the Aeroplane Over the Sea", "Neutral Milk Hotel", 1998, "Indie Folk", "Merge Records", 11, "FLAC", 1411),
+    DemoAlbum("Funeral", "Arcade Fire", 2004, "Indie Rock", "Merge Records", 10, "MP3", 320),
+    DemoAlbum("Is This It", "The Strokes", 2001, "Indie Rock", "RCA", 11, "MP3", 320),
+    DemoAlbum("Kid A", "Radiohead", 2000, "Art Rock", "Parlophone", 10, "FLAC", 1411),
+    DemoAlbum("Yankee Hotel Foxtrot", "Wilco", 2002, "Alt-Country", "Nonesuch", 11, "FLAC", 1411),
+    DemoAlbum("Loveless", "My Bloody Valentine", 1991, "Shoegaze", "Creation Records", 11, "FLAC", 1411),
+    DemoAlbum("Blue", "Joni Mitchell", 1971, "Folk", "Reprise Records", 10, "FLAC", 1411),
     # Country / Americana
-    {"title": "At Folsom Prison", "artist": "Johnny Cash", "year": 1968, "genre": "Country", "label": "Columbia", "tracks": 28, "format": "MP3", "bitrate": 320},
-    {"title": "Harvest", "artist": "Neil Young", "year": 1972, "genre": "Country Rock", "label": "Reprise", "tracks": 10, "format": "FLAC", "bitrate": 1411},
+    DemoAlbum("At Folsom Prison", "Johnny Cash", 1968, "Country", "Columbia", 28, "MP3", 320),
+    DemoAlbum("Harvest", "Neil Young", 1972, "Country Rock", "Reprise", 10, "FLAC", 1411),
     # World / Reggae
-    {"title": "Legend", "artist": "Bob Marley & The Wailers", "year": 1984, "genre": "Reggae", "label": "Island Records", "tracks": 14, "format": "MP3", "bitrate": 320},
-    {"title": "Graceland", "artist": "Paul Simon", "year": 1986, "genre": "World", "label": "Warner Bros.", "tracks": 11, "format": "FLAC", "bitrate": 1411},
+    DemoAlbum("Legend", "Bob Marley & The Wailers", 1984, "Reggae", "Island Records", 14, "MP3", 320),
+    DemoAlbum("Graceland", "Paul Simon", 1986, "World", "Warner Bros.", 11, "FLAC", 1411),
     # Pop
-    {"title": "Thriller", "artist": "Michael Jackson", "year": 1982, "genre": "Pop", "label": "Epic Records", "tracks": 9, "format": "MP3", "bitrate": 320},
-    {"title": "Ray of Light", "artist": "Madonna", "year": 1998, "genre": "Pop", "label": "Maverick", "tracks": 13, "format": "MP3", "bitrate": 320},
-    {"title": "Tapestry", "artist": "Carole King", "year": 1971, "genre": "Pop", "label": "Ode Records", "tracks": 13, "format": "FLAC", "bitrate": 1411},
+    DemoAlbum("Thriller", "Michael Jackson", 1982, "Pop", "Epic Records", 9, "MP3", 320),
+    DemoAlbum("Ray of Light", "Madonna", 1998, "Pop", "Maverick", 13, "MP3", 320),
+    DemoAlbum("Tapestry", "Carole King", 1971, "Pop", "Ode Records", 13, "FLAC", 1411),
     # Metal
-    {"title": "Master of Puppets", "artist": "Metallica", "year": 1986, "genre": "Heavy Metal", "label": "Elektra", "tracks": 8, "format": "MP3", "bitrate": 320},
-    {"title": "Rust in Peace", "artist": "Megadeth", "year": 1990, "genre": "Thrash Metal", "label": "Capitol", "tracks": 9, "format": "MP3", "bitrate": 320},
+    DemoAlbum("Master of Puppets", "Metallica", 1986, "Heavy Metal", "Elektra", 8, "MP3", 320),
+    DemoAlbum("Rust in Peace", "Megadeth", 1990, "Thrash Metal", "Capitol", 9, "MP3", 320),
     # Punk
-    {"title": "London Calling", "artist": "The Clash", "year": 1979, "genre": "Punk", "label": "CBS", "tracks": 19, "format": "MP3", "bitrate": 320},
-    {"title": "Never Mind the Bollocks", "artist": "Sex Pistols", "year": 1977, "genre": "Punk", "label": "Virgin", "tracks": 12, "format": "MP3", "bitrate": 320},
+    DemoAlbum("London Calling", "The Clash", 1979, "Punk", "CBS", 19, "MP3", 320),
+    DemoAlbum("Never Mind the Bollocks", "Sex Pistols", 1977, "Punk", "Virgin", 12, "MP3", 320),
     # Extra
-    {"title": "Pet Sounds", "artist": "The Beach Boys", "year": 1966, "genre": "Pop", "label": "Capitol", "tracks": 13, "format": "FLAC", "bitrate": 1411},
-    {"title": "Songs of Leonard Cohen", "artist": "Leonard Cohen", "year": 1967, "genre": "Folk", "label": "Columbia", "tracks": 10, "format": "FLAC", "bitrate": 1411},
-]
+    DemoAlbum("Pet Sounds", "The Beach Boys", 1966, "Pop", "Capitol", 13, "FLAC", 1411),
+    DemoAlbum("Songs of Leonard Cohen", "Leonard Cohen", 1967, "Folk", "Columbia", 10, "FLAC", 1411),
+)
 
 # Realistic track title patterns per genre
 TRACK_TEMPLATES = {
-    "Rock": ["Intro", "Highway Jam", "Electric Daydream", "Stone Cold", "Fire in the Sky",
+    "Rock": ("Intro", "Highway Jam", "Electric Daydream", "Stone Cold", "Fire in the Sky",
              "Midnight Rider", "Rolling Thunder", "Last Train Home", "Gasoline Dreams", "Iron Curtain",
-             "River of Souls", "Locomotive", "Desert Rain", "Signal Fire", "Ghost Road"],
-    "Electronic": ["System Boot", "Radiant Flux", "Data Stream", "Neon Pulse", "Binary Sunset",
+             "River of Souls", "Locomotive", "Desert Rain", "Signal Fire", "Ghost Road"),
+    "Electronic": ("System Boot", "Radiant Flux", "Data Stream", "Neon Pulse", "Binary Sunset",
                    "Frequency Drift", "Vapor Trail", "Circuit Breaker", "Phase Shift", "Resonance",
-                   "Sync", "Module 7", "Echo Chamber", "Particle Storm", "White Noise"],
-    "Hip-Hop": ["Intro", "Street Wisdom", "Hard Knock", "Crown Heights", "Real Talk",
+                   "Sync", "Module 7", "Echo Chamber", "Particle Storm", "White Noise"),
+    "Hip-Hop": ("Intro", "Street Wisdom", "Hard Knock", "Crown Heights", "Real Talk",
                 "Paper Chase", "Night Moves", "Still Standing", "Block Party", "On the Come Up",
-                "Hustle Hard", "Concrete Jungle", "No Sleep", "Outro", "Freestyle"],
-    "Jazz": ["Prelude", "Blue Note", "After Midnight", "Walking Bass", "Modal Shift",
-             "Cool Breeze", "Ballad for No One", "Uptempo", "The Change", "Resolution"],
-    "Classical": ["Allegro", "Andante", "Scherzo", "Adagio", "Presto",
-                  "Rondo", "Minuet", "Theme and Variations", "Coda", "Overture"],
-    "default": ["Opening", "Main Theme", "Interlude", "Bridge", "Chorus",
+                "Hustle Hard", "Concrete Jungle", "No Sleep", "Outro", "Freestyle"),
+    "Jazz": ("Prelude", "Blue Note", "After Midnight", "Walking Bass", "Modal Shift",
+             "Cool Breeze", "Ballad for No One", "Uptempo", "The Change", "Resolution"),
+    "Classical": ("Allegro", "Andante", "Scherzo", "Adagio", "Presto",
+                  "Rondo", "Minuet", "Theme and Variations", "Coda", "Overture"),
+    "default": ("Opening", "Main Theme", "Interlude", "Bridge", "Chorus",
                 "Verse", "Outro", "Reprise", "Finale", "Coda",
-                "Movement I", "Movement II", "Movement III", "Movement IV", "Epilogue"],
+                "Movement I", "Movement II", "Movement III", "Movement IV", "Epilogue"),
 }
 
 
 def get_track_names(genre: str, count: int) -> list[str]:
     templates = TRACK_TEMPLATES.get(genre, TRACK_TEMPLATES["default"])
     # If we need more than available templates, cycle through
-    names = []
-    for i in range(count):
-        names.append(templates[i % len(templates)])
-    return names
+    return list(islice(cycle(templates), count))
 
 
-def track_duration() -> int:
-    """Random track duration in seconds (2:00 – 8:30)."""
-    return random.randint(120, 510)
+# Possible track durations in seconds (2:00 – 8:30)
+TRACK_DURATIONS = range(120, 511)
 
 
 # ---------------------------------------------------------------------------
 # Database setup
 # ---------------------------------------------------------------------------
 
-def get_db() -> sqlite3.Connection:
-    conn = sqlite3.connect(str(DB_PATH))
+# Connections are opened once and reused for the lifetime of the process:
+# a small pool of up to READ_POOL_SIZE read connections plus a single
+# shared writer.  Route handlers are plain ``def`` functions so FastAPI
+# runs the blocking sqlite3 calls in its threadpool instead of on the
+# event loop; writes go through ``write_lock`` so only one thread uses
+# the writer at a time.  Read connections must go back to the pool with
+# no open statement, or they would pin an old WAL snapshot for the next
+# borrower, and must never be held across a ``yield`` to the server:
+# a borrower parked there ties up a connection that waiting threads
+# cannot get back.
+READ_POOL_SIZE = 4
+READ_POOL_TIMEOUT = 10
+PRAGMAS = """
+    PRAGMA journal_mode = WAL;
+    PRAGMA synchronous = NORMAL;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -64000;
+    PRAGMA mmap_size = 268435456;
+"""
+
+_read_pool: queue.SimpleQueue[sqlite3.Connection] = queue.SimpleQueue()
+_readers_opened = 0
+_pool_lock = threading.Lock()
+_connections: list[sqlite3.Connection] = []
+_writer: Optional[sqlite3.Connection] = None
+write_lock = threading.Lock()
+
+
+def _connect(query_only: bool = False) -> sqlite3.Connection:
+    conn = sqlite3.connect(str(DB_PATH), check_same_thread=False, cached_statements=512)
     conn.row_factory = sqlite3.Row
+    conn.executescript(PRAGMAS)
+    if query_only:
+        conn.execute("PRAGMA query_only = 1")
+    _connections.append(conn)
     return conn
 
 
+@contextmanager
+def read_db() -> Iterator[sqlite3.Connection]:
+    """Borrow a read connection from the pool for the ``with`` block.
+
+    A new connection is opened while fewer than READ_POOL_SIZE exist;
+    after that, callers wait up to READ_POOL_TIMEOUT seconds for one to
+    be returned before giving up with a 503.
+    """
+    global _readers_opened
+    try:
+        conn = _read_pool.get_nowait()
+    except queue.Empty:
+        with _pool_lock:
+            grow = _readers_opened < READ_POOL_SIZE
+            if grow:
+                _readers_opened += 1
+        if not grow:
+            try:
+                conn = _read_pool.get(timeout=READ_POOL_TIMEOUT)
+            except queue.Empty:
+                raise HTTPException(status_code=503, detail="Database busy")
+        else:
+            try:
+                conn = _connect(query_only=True)
+            except sqlite3.Error:
+                with _pool_lock:
+                    _readers_opened -= 1
+                raise
+    try:
+        yield conn
+    finally:
+        _read_pool.put(conn)
+
+
+def get_write_db() -> sqlite3.Connection:
+    """Return the shared writer connection."""
+    global _writer
+    if _writer is None:
+        _writer = _connect()
+    return _writer
+
+
+def close_db():
+    global _read_pool, _readers_opened, _writer
+    while _connections:
+        _connections.pop().close()
+    _read_pool = queue.SimpleQueue()
+    _readers_opened = 0
+    _writer = None
+
+
+class OrjsonResponse(Response):
+    """JSON response serialized with orjson.
+
+    Stands in for FastAPI's ``ORJSONResponse``, which is deprecated and
+    warns on every instantiation.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Stats and sidebar aggregates only change when albums do, so they are
+# cached in-process and invalidated by bumping _cache_version on album
+# writes.  _cache_epoch keeps ETags from one process run from matching
+# the next.
+_cache_version = 0
+_cache_epoch = os.urandom(4).hex()
+_response_cache: dict[str, tuple[int, Any]] = {}
+
+
+def invalidate_cache():
+    global _cache_version
+    _cache_version += 1
+
+
+def cached(key: str, compute) -> Any:
+    hit = _response_cache.get(key)
+    if hit is not None and hit[0] == _cache_version:
+        return hit[1]
+    version = _cache_version
+    value = compute()
+    _response_cache[key] = (version, value)
+    return value
+
+
+def cached_response(request: Request, key: str, compute) -> Response:
+    """Serve ``cached(key, compute)`` with an ETag, or 304 if unchanged."""
+    etag = f'W/"{_cache_epoch}-{_cache_version}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return OrjsonResponse(cached(key, compute), headers=headers)
+
+
 def init_db():
     """Create schema and seed demo data if database is empty."""
-    conn = get_db()
+    conn = get_write_db()
     cur = conn.cursor()
 
+    has_tracks_fts = cur.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'tracks_fts'"
+    ).fetchone()
+
+    # Libraries created before artists.album_count was denormalized
+    artist_cols = [r[1] for r in cur.execute("PRAGMA table_info(artists)")]
+    if artist_cols and "album_count" not in artist_cols:
+        with conn:
+            cur.execute(
+                "ALTER TABLE artists ADD COLUMN album_count INTEGER NOT NULL DEFAULT 0"
+            )
+            cur.execute(
+                """UPDATE artists SET album_count =
+                   (SELECT COUNT(*) FROM albums WHERE albums.artist_id = artists.id)"""
+            )
+
     cur.executescript("""
         CREATE TABLE IF NOT EXISTS artists (
             id      INTEGER PRIMARY KEY AUTOINCREMENT,
             name    TEXT NOT NULL UNIQUE,
-            sort    TEXT
+            sort    TEXT,
+            album_count INTEGER NOT NULL DEFAULT 0
         );
 
         CREATE TABLE IF NOT EXISTS albums (
@@ -200,60 +360,157 @@ def init_db():
             content='albums',
             content_rowid='id'
         );
+
+        -- Keep albums_fts in sync row by row instead of rebuilding it
+        CREATE TRIGGER IF NOT EXISTS albums_ai AFTER INSERT ON albums BEGIN
+            INSERT INTO albums_fts(rowid, title, artist, genre, label)
+            VALUES (new.id, new.title, new.artist, new.genre, new.label);
+        END;
+        CREATE TRIGGER IF NOT EXISTS albums_ad AFTER DELETE ON albums BEGIN
+            INSERT INTO albums_fts(albums_fts, rowid, title, artist, genre, label)
+            VALUES ('delete', old.id, old.title, old.artist, old.genre, old.label);
+        END;
+        CREATE TRIGGER IF NOT EXISTS albums_au AFTER UPDATE OF title, artist, genre, label ON albums BEGIN
+            INSERT INTO albums_fts(albums_fts, rowid, title, artist, genre, label)
+            VALUES ('delete', old.id, old.title, old.artist, old.genre, old.label);
+            INSERT INTO albums_fts(rowid, title, artist, genre, label)
+            VALUES (new.id, new.title, new.artist, new.genre, new.label);
+        END;
+
+        CREATE VIRTUAL TABLE IF NOT EXISTS tracks_fts USING fts5(
+            title, artist,
+            content='tracks',
+            content_rowid='id'
+        );
+
+        CREATE TRIGGER IF NOT EXISTS tracks_ai AFTER INSERT ON tracks BEGIN
+            INSERT INTO tracks_fts(rowid, title, artist)
+            VALUES (new.id, new.title, new.artist);
+        END;
+        CREATE TRIGGER IF NOT EXISTS tracks_ad AFTER DELETE ON tracks BEGIN
+            INSERT INTO tracks_fts(tracks_fts, rowid, title, artist)
+            VALUES ('delete', old.id, old.title, old.artist);
+        END;
+        CREATE TRIGGER IF NOT EXISTS tracks_au AFTER UPDATE OF title, artist ON tracks BEGIN
+            INSERT INTO tracks_fts(tracks_fts, rowid, title, artist)
+            VALUES ('delete', old.id, old.title, old.artist);
+            INSERT INTO tracks_fts(rowid, title, artist)
+            VALUES (new.id, new.title, new.artist);
+        END;
+
+        -- Keep artists.album_count in step with albums
+        CREATE TRIGGER IF NOT EXISTS albums_ai_count AFTER INSERT ON albums BEGIN
+            UPDATE artists SET album_count = album_count + 1 WHERE id = new.artist_id;
+        END;
+        CREATE TRIGGER IF NOT EXISTS albums_ad_count AFTER DELETE ON albums BEGIN
+            UPDATE artists SET album_count = album_count - 1 WHERE id = old.artist_id;
+        END;
+        CREATE TRIGGER IF NOT EXISTS albums_au_count AFTER UPDATE OF artist_id ON albums BEGIN
+            UPDATE artists SET album_count = album_count - 1 WHERE id = old.artist_id;
+            UPDATE artists SET album_count = album_count + 1 WHERE id = new.artist_id;
+        END;
+
+        -- Deleting an album takes its tracks with it
+        CREATE TRIGGER IF NOT EXISTS albums_ad_tracks AFTER DELETE ON albums BEGIN
+            DELETE FROM tracks WHERE album_id = old.id;
+        END;
+
+        CREATE INDEX IF NOT EXISTS idx_artists_count ON artists(album_count DESC, name);
+        CREATE INDEX IF NOT EXISTS idx_albums_artist_id ON albums(artist_id);
+        CREATE INDEX IF NOT EXISTS idx_tracks_album_id ON tracks(album_id);
+
+        -- Sort orders used by /api/albums (rowid is the implicit tiebreaker);
+        -- the expressions must match sort_expr() for the planner to use them
+        CREATE INDEX IF NOT EXISTS idx_albums_year_desc ON albums(IFNULL(year, 0) DESC, title);
+        CREATE INDEX IF NOT EXISTS idx_albums_year_asc ON albums(IFNULL(year, 0), title);
+        CREATE INDEX IF NOT EXISTS idx_albums_title ON albums(title);
+        CREATE INDEX IF NOT EXISTS idx_albums_artist_year ON albums(artist, IFNULL(year, 0) DESC);
     """)
 
+    # Index tracks already in a library created before tracks_fts existed
+    if not has_tracks_fts:
+        with conn:
+            cur.execute("INSERT INTO tracks_fts(tracks_fts) VALUES ('rebuild')")
+
+    has_stats = cur.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+    ).fetchone()
+
     # Seed if empty
     row = cur.execute("SELECT COUNT(*) FROM albums").fetchone()
     if row[0] == 0:
         _seed_demo_data(conn)
+        invalidate_cache()
+        has_stats = None
+
+    # Give the query planner statistics for the indexes above
+    if not has_stats:
+        cur.execute("ANALYZE")
 
     conn.commit()
-    conn.close()
 
 
 def _seed_demo_data(conn: sqlite3.Connection):
     cur = conn.cursor()
     random.seed(42)
 
+    # Draw every track duration at once rather than one call per track
+    total_tracks = sum(album.tracks for album in DEMO_ALBUMS)
+    durations = iter(random.choices(TRACK_DURATIONS, k=total_tracks))
+
+    artist_rows = []
+    album_rows = []
+    album_tracks = []
     for album in DEMO_ALBUMS:
-        # Upsert artist
-        cur.execute(
-            "INSERT OR IGNORE INTO artists (name, sort) VALUES (?, ?)",
-            (album["artist"], album["artist"].lstrip("The ").lstrip("A "))
+        artist_rows.append(
+            (album.artist, album.artist.lstrip("The ").lstrip("A "))
         )
-        artist_id = cur.execute(
-            "SELECT id FROM artists WHERE name = ?", (album["artist"],)
-        ).fetchone()[0]
-
-        # Insert album
-        n_tracks = album["tracks"]
-        duration = sum(track_duration() for _ in range(n_tracks))
-        cur.execute(
-            """INSERT INTO albums
-               (title, artist_id, artist, year, genre, label, format, bitrate, track_count, duration)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (album["title"], artist_id, album["artist"], album["year"],
-             album["genre"], album["label"], album["format"],
-             album["bitrate"], n_tracks, duration)
+        n_tracks = album.tracks
+        names = get_track_names(album.genre, n_tracks)
+        tracks = list(zip(names, islice(durations, n_tracks)))
+        album_tracks.append(tracks)
+        album_rows.append(
+            (album.title, album.artist, album.year,
+             album.genre, album.label, album.format,
+             album.bitrate, n_tracks, sum(tdur for _, tdur in tracks))
         )
-        album_id = cur.lastrowid
 
-        # Insert tracks
-        names = get_track_names(album["genre"], n_tracks)
-        for i, tname in enumerate(names, start=1):
-            tdur = track_duration()
-            fake_path = f"/music/{album['artist']}/{album['title']}/{i:02d} - {tname}.{album['format'].lower()}"
-            cur.execute(
+    # The whole seed is one throwaway transaction; skip the fsyncs.
+    cur.execute("PRAGMA synchronous = OFF")
+    try:
+        with conn:
+            cur.executemany(
+                "INSERT OR IGNORE INTO artists (name, sort) VALUES (?, ?)",
+                artist_rows
+            )
+            artist_ids = dict(cur.execute("SELECT name, id FROM artists"))
+
+            # Albums are only seeded into an empty table, so ids come back
+            # in insertion order.
+            cur.executemany(
+                """INSERT INTO albums
+                   (title, artist_id, artist, year, genre, label, format, bitrate, track_count, duration)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                [(row[0], artist_ids[row[1]]) + row[1:] for row in album_rows]
+            )
+            album_ids = [r[0] for r in cur.execute("SELECT id FROM albums ORDER BY id")]
+
+            track_rows = []
+            for album, album_id, tracks in zip(DEMO_ALBUMS, album_ids, album_tracks):
+                for i, (tname, tdur) in enumerate(tracks, start=1):
+                    fake_path = f"/music/{album.artist}/{album.title}/{i:02d} - {tname}.{album.format.lower()}"
+                    track_rows.append(
+                        (album_id, tname, album.artist, i, 1, tdur,
+                         album.format, album.bitrate, fake_path)
+                    )
+            cur.executemany(
                 """INSERT INTO tracks
                    (album_id, title, artist, track_num, disc_num, duration, format, bitrate, path)
                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (album_id, tname, album["artist"], i, 1, tdur,
-                 album["format"], album["bitrate"], fake_path)
+                track_rows
             )
-
-    # Rebuild FTS
-    cur.execute("INSERT INTO albums_fts(albums_fts) VALUES ('rebuild')")
-    conn.commit()
+    finally:
+        cur.execute("PRAGMA synchronous = NORMAL")
 
 
 # ---------------------------------------------------------------------------
@@ -264,25 +521,73 @@ def _seed_demo_data(conn: sqlite3.Connection):
 async def lifespan(app: FastAPI):
     init_db()
     yield
+    close_db()
 
 
 # ---------------------------------------------------------------------------
 # App
 # ---------------------------------------------------------------------------
 
+# Every origin is allowed and no credentials are involved, so the CORS
+# headers never vary and can be built once.
+CORS_HEADERS = [(b"access-control-allow-origin", b"*")]
+PREFLIGHT_HEADERS = CORS_HEADERS + [
+    (b"access-control-allow-methods", b"*"),
+    (b"access-control-allow-headers", b"*"),
+    (b"access-control-max-age", b"600"),
+]
+
+
+class StaticCORSMiddleware:
+    """Add the constant CORS headers and answer preflights directly."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and any(
+            name == b"access-control-request-method" for name, _ in scope["headers"]
+        ):
+            await send({"type": "http.response.start", "status": 204, "headers": PREFLIGHT_HEADERS})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + CORS_HEADERS
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+
+class APIGZipMiddleware:
+    """Gzip the JSON API responses; the UI and static files pass through."""
+
+    def __init__(self, app, minimum_size: int = 1024):
+        self.app = app
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith("/api/"):
+            await self.gzip(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
+
 app = FastAPI(
     title="beets web UI",
     description="Modern web management interface for your beets music library",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=OrjsonResponse,
 )
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+app.add_middleware(APIGZipMiddleware, minimum_size=1024)
+app.add_middleware(StaticCORSMiddleware)
 
 # Mount static files
 app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
@@ -310,6 +615,7 @@ class TrackUpdate(BaseModel):
 # Helper
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=4096)
 def fmt_duration(seconds: int) -> str:
     h = seconds // 3600
     m = (seconds % 3600) // 60
@@ -323,6 +629,179 @@ def row_to_dict(row: sqlite3.Row) -> dict:
     return dict(row)
 
 
+def fts_query(q: str) -> str:
+    """Turn free-text input into an FTS5 query of quoted prefix terms.
+
+    Quoting keeps user input from being parsed as FTS5 syntax (column
+    filters, NEAR, bare operators), which would otherwise raise or match
+    unexpectedly.
+    """
+    return " ".join('"' + term.replace('"', '""') + '"*' for term in q.split())
+
+
+# Columns returned by the listing endpoints; the album grid has no use for
+# artist_id or added, and tracks drop their format/bitrate/path.
+ALBUM_LIST_COLS = (
+    "id", "title", "artist", "year", "genre", "label",
+    "format", "bitrate", "track_count", "duration",
+)
+ALBUM_FIELDS = ALBUM_LIST_COLS + ("artist_id", "added")
+TRACK_LIST_COLS = (
+    "id", "album_id", "title", "artist", "track_num", "disc_num", "duration",
+)
+
+STREAM_BATCH = 50
+
+
+def stream_items(sql: str, params: list, finish) -> StreamingResponse:
+    """Stream the rows of ``sql`` as ``{"items": [...], ...}``.
+
+    Listings are capped at 200 rows, so the page is read in full on a
+    pooled connection that goes straight back to the pool; only the
+    serialization is streamed, in batches, as the response is sent.
+    Rows come back as plain tuples and are zipped with the column names
+    once per row instead of going through ``sqlite3.Row``.
+    ``finish(last_row, count)`` returns the keys that follow ``items``.
+    """
+    with read_db() as conn:
+        cur = conn.cursor()
+        try:
+            cur.row_factory = None
+            rows = cur.execute(sql, params).fetchall()
+            cols = tuple(d[0] for d in cur.description)
+        finally:
+            cur.close()
+
+    def generate():
+        yield b'{"items":['
+        for start in range(0, len(rows), STREAM_BATCH):
+            batch = rows[start:start + STREAM_BATCH]
+            chunk = b",".join(orjson.dumps(dict(zip(cols, r))) for r in batch)
+            yield (b"," + chunk) if start else chunk
+        last = dict(zip(cols, rows[-1])) if rows else None
+        yield b"]," + orjson.dumps(finish(last, len(rows)))[1:]
+
+    return StreamingResponse(generate(), media_type="application/json")
+
+
+def encode_cursor(values: list) -> str:
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+def decode_cursor(cursor: str, size: int) -> list:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if (
+        not isinstance(values, list)
+        or len(values) != size
+        or not all(v is None or isinstance(v, (str, int, float)) for v in values)
+    ):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+
+# Nullable sort columns are ordered by IFNULL(col, default) so a keyset
+# comparison can step past NULLs; 0 keeps NULL years where SQLite itself
+# sorts them (before every real year).
+NULL_SORT_DEFAULTS = {"year": 0}
+
+
+def sort_expr(col: str) -> str:
+    default = NULL_SORT_DEFAULTS.get(col)
+    return col if default is None else f"IFNULL({col}, {default})"
+
+
+def sort_values(keys: tuple, row: dict) -> list:
+    """The values of ``row`` that ``keys`` sorts on, as stored in a cursor."""
+    return [
+        NULL_SORT_DEFAULTS.get(col) if row[col] is None else row[col]
+        for col, _ in keys
+    ]
+
+
+def keyset_condition(keys: tuple) -> str:
+    """WHERE clause selecting the rows that sort after a cursor.
+
+    ``keys`` is a sequence of ``(column, direction)`` pairs.  When every
+    key runs the same way the comparison is a single row value; mixed
+    ASC/DESC orders are expanded term by term.  Either way it sits behind
+    a redundant bound on the first key, which is what lets SQLite seek
+    the sort index instead of scanning it.  Bind it with
+    ``keyset_params(keys, values)``.
+    """
+    exprs = [sort_expr(col) for col, _ in keys]
+    ops = ["<" if direction == "DESC" else ">" for _, direction in keys]
+    bound = f"{exprs[0]} {ops[0]}= ?"
+    if len(set(ops)) == 1:
+        placeholders = ", ".join("?" * len(keys))
+        return f"{bound} AND ({', '.join(exprs)}) {ops[0]} ({placeholders})"
+
+    terms = []
+    for i, (expr, op) in enumerate(zip(exprs, ops)):
+        term = [f"{e} = ?" for e in exprs[:i]] + [f"{expr} {op} ?"]
+        terms.append("(" + " AND ".join(term) + ")")
+    return f"{bound} AND (" + " OR ".join(terms) + ")"
+
+
+def keyset_params(keys: tuple, values: list) -> list:
+    params = [values[0]]
+    if len({direction for _, direction in keys}) == 1:
+        return params + list(values)
+    for i in range(len(values)):
+        params.extend(values[: i + 1])
+    return params
+
+
+ALBUM_SORTS = {
+    "year_desc": (("year", "DESC"), ("title", "ASC"), ("id", "ASC")),
+    "year_asc": (("year", "ASC"), ("title", "ASC"), ("id", "ASC")),
+    "title": (("title", "ASC"), ("id", "ASC")),
+    "artist": (("artist", "ASC"), ("year", "DESC"), ("id", "ASC")),
+}
+
+
+@lru_cache(maxsize=256)
+def albums_sql(
+    columns: tuple,
+    sort: str,
+    has_match: bool,
+    has_genre: bool,
+    has_artist: bool,
+    has_format: bool,
+    has_cursor: bool,
+) -> tuple[str, str]:
+    """Return the count and page queries for one shape of /api/albums.
+
+    There are only a handful of shapes, so each SQL string is built once
+    and the connection's statement cache can reuse its prepared form.
+    """
+    conditions = []
+    if has_match:
+        # FTS search, filtered in the same statement as the page query
+        conditions.append("id IN (SELECT rowid FROM albums_fts WHERE albums_fts MATCH ?)")
+    if has_genre:
+        conditions.append("genre = ?")
+    if has_artist:
+        conditions.append("artist = ?")
+    if has_format:
+        conditions.append("format = ?")
+    where = ("WHERE " + " AND ".join(conditions)) if conditions else ""
+    count_sql = f"SELECT COUNT(*) FROM albums {where}"
+
+    keys = ALBUM_SORTS[sort]
+    if has_cursor:
+        conditions.append(keyset_condition(keys))
+    where = ("WHERE " + " AND ".join(conditions)) if conditions else ""
+    order = ", ".join(f"{sort_expr(col)} {direction}" for col, direction in keys)
+    page_sql = (
+        f"SELECT {', '.join(columns)} FROM albums {where} "
+        f"ORDER BY {order} LIMIT ? OFFSET ?"
+    )
+    return count_sql, page_sql
+
+
 # ---------------------------------------------------------------------------
 # Routes — UI
 # ---------------------------------------------------------------------------
@@ -337,20 +816,23 @@ async def index():
 # ---------------------------------------------------------------------------
 
 @app.get("/api/stats")
-async def get_stats():
-    conn = get_db()
-    cur = conn.cursor()
-
-    total_albums = cur.execute("SELECT COUNT(*) FROM albums").fetchone()[0]
-    total_tracks = cur.execute("SELECT COUNT(*) FROM tracks").fetchone()[0]
-    total_artists = cur.execute("SELECT COUNT(*) FROM artists").fetchone()[0]
-    total_duration = cur.execute("SELECT COALESCE(SUM(duration), 0) FROM albums").fetchone()[0]
-    genres = cur.execute("SELECT COUNT(DISTINCT genre) FROM albums").fetchone()[0]
-    formats = cur.execute(
-        "SELECT format, COUNT(*) as cnt FROM albums GROUP BY format ORDER BY cnt DESC"
-    ).fetchall()
+def get_stats(request: Request):
+    return cached_response(request, "stats", _compute_stats)
+
+
+def _compute_stats() -> dict:
+    with read_db() as conn:
+        total_albums, total_tracks, total_artists, total_duration, genres = conn.execute(
+            """SELECT (SELECT COUNT(*) FROM albums),
+                      (SELECT COUNT(*) FROM tracks),
+                      (SELECT COUNT(*) FROM artists),
+                      (SELECT COALESCE(SUM(duration), 0) FROM albums),
+                      (SELECT COUNT(DISTINCT genre) FROM albums)"""
+        ).fetchone()
+        formats = conn.execute(
+            "SELECT format, COUNT(*) as cnt FROM albums GROUP BY format ORDER BY cnt DESC"
+        ).fetchall()
 
-    conn.close()
     return {
         "total_albums": total_albums,
         "total_tracks": total_tracks,
@@ -367,7 +849,7 @@ async def get_stats():
 # ---------------------------------------------------------------------------
 
 @app.get("/api/albums")
-async def list_albums(
+def list_albums(
     q: Optional[str] = Query(None, description="Search query"),
     genre: Optional[str] = Query(None),
     artist: Optional[str] = Query(None),
@@ -375,124 +857,102 @@ async def list_albums(
     sort: str = Query("year_desc", description="year_asc|year_desc|title|artist"),
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    include_total: bool = Query(False, description="Also count all matching albums"),
+    fields: Optional[str] = Query(None, description="Comma-separated columns to return"),
 ):
-    conn = get_db()
-    cur = conn.cursor()
-
-    conditions = []
-    params: list = []
-
-    if q:
-        # FTS search — get matching IDs
-        fts_rows = cur.execute(
-            "SELECT rowid FROM albums_fts WHERE albums_fts MATCH ? LIMIT 200",
-            (q,)
-        ).fetchall()
-        if not fts_rows:
-            conn.close()
-            return {"items": [], "total": 0}
-        ids = [r[0] for r in fts_rows]
-        placeholders = ",".join("?" * len(ids))
-        conditions.append(f"id IN ({placeholders})")
-        params.extend(ids)
-
-    if genre:
-        conditions.append("genre = ?")
-        params.append(genre)
-    if artist:
-        conditions.append("artist = ?")
-        params.append(artist)
-    if format:
-        conditions.append("format = ?")
-        params.append(format)
-
-    where = ("WHERE " + " AND ".join(conditions)) if conditions else ""
+    if fields:
+        columns = list(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+        unknown = set(columns) - set(ALBUM_FIELDS)
+        if unknown:
+            raise HTTPException(
+                status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}"
+            )
+    else:
+        columns = list(ALBUM_LIST_COLS)
+
+    if sort not in ALBUM_SORTS:
+        sort = "year_desc"
+    keys = ALBUM_SORTS[sort]
+    # The sort key is always selected so the next cursor can be built
+    columns += [col for col, _ in keys if col not in columns]
+
+    match = fts_query(q) if q else ""
+    params = [value for value in (match, genre, artist, format) if value]
+    count_sql, page_sql = albums_sql(
+        tuple(columns), sort,
+        bool(match), bool(genre), bool(artist), bool(format), bool(cursor),
+    )
 
-    order_map = {
-        "year_desc": "year DESC, title ASC",
-        "year_asc": "year ASC, title ASC",
-        "title": "title ASC",
-        "artist": "artist ASC, year DESC",
-    }
-    order = order_map.get(sort, "year DESC, title ASC")
+    total = None
+    if include_total:
+        with read_db() as conn:
+            total = conn.execute(count_sql, params).fetchone()[0]
 
-    total = cur.execute(
-        f"SELECT COUNT(*) FROM albums {where}", params
-    ).fetchone()[0]
+    # Keyset pagination: seek past the last row of the previous page
+    # instead of scanning and discarding ``offset`` rows.
+    if cursor:
+        params += keyset_params(keys, decode_cursor(cursor, len(keys)))
+        offset = 0
 
-    rows = cur.execute(
-        f"SELECT * FROM albums {where} ORDER BY {order} LIMIT ? OFFSET ?",
-        params + [limit, offset]
-    ).fetchall()
+    def finish(last, count):
+        next_cursor = None
+        if count == limit:
+            next_cursor = encode_cursor(sort_values(keys, last))
+        return {
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+            "has_more": next_cursor is not None,
+            "next_cursor": next_cursor,
+        }
 
-    conn.close()
-    return {
-        "items": [row_to_dict(r) for r in rows],
-        "total": total,
-        "limit": limit,
-        "offset": offset,
-    }
+    return stream_items(page_sql, params + [limit, offset], finish)
 
 
 @app.get("/api/albums/{album_id}")
-async def get_album(album_id: int):
-    conn = get_db()
-    cur = conn.cursor()
-    row = cur.execute("SELECT * FROM albums WHERE id = ?", (album_id,)).fetchone()
-    if not row:
-        conn.close()
-        raise HTTPException(status_code=404, detail="Album not found")
+def get_album(album_id: int):
+    with read_db() as conn:
+        row = conn.execute("SELECT * FROM albums WHERE id = ?", (album_id,)).fetchone()
+        if not row:
+            raise HTTPException(status_code=404, detail="Album not found")
+        tracks = conn.execute(
+            "SELECT * FROM tracks WHERE album_id = ? ORDER BY disc_num, track_num",
+            (album_id,)
+        ).fetchall()
     album = row_to_dict(row)
-    tracks = cur.execute(
-        "SELECT * FROM tracks WHERE album_id = ? ORDER BY disc_num, track_num",
-        (album_id,)
-    ).fetchall()
     album["tracks"] = [row_to_dict(t) for t in tracks]
-    conn.close()
     return album
 
 
 @app.patch("/api/albums/{album_id}")
-async def update_album(album_id: int, body: AlbumUpdate):
-    conn = get_db()
-    cur = conn.cursor()
-
-    row = cur.execute("SELECT id FROM albums WHERE id = ?", (album_id,)).fetchone()
-    if not row:
-        conn.close()
-        raise HTTPException(status_code=404, detail="Album not found")
-
+def update_album(album_id: int, body: AlbumUpdate):
     updates = body.model_dump(exclude_none=True)
     if not updates:
-        conn.close()
         raise HTTPException(status_code=400, detail="No fields to update")
 
+    conn = get_write_db()
     set_clause = ", ".join(f"{k} = ?" for k in updates)
-    cur.execute(
-        f"UPDATE albums SET {set_clause} WHERE id = ?",
-        list(updates.values()) + [album_id]
-    )
-    conn.commit()
-
-    # Rebuild FTS
-    cur.execute("INSERT INTO albums_fts(albums_fts) VALUES ('rebuild')")
-    conn.commit()
-
-    result = cur.execute("SELECT * FROM albums WHERE id = ?", (album_id,)).fetchone()
-    conn.close()
+    with write_lock:
+        with conn:
+            cur = conn.execute(
+                f"UPDATE albums SET {set_clause} WHERE id = ?",
+                list(updates.values()) + [album_id]
+            )
+            if not cur.rowcount:
+                raise HTTPException(status_code=404, detail="Album not found")
+        invalidate_cache()
+        # Read back through the writer so the response reflects this commit
+        result = conn.execute("SELECT * FROM albums WHERE id = ?", (album_id,)).fetchone()
     return row_to_dict(result)
 
 
 @app.delete("/api/albums/{album_id}")
-async def delete_album(album_id: int):
-    conn = get_db()
-    cur = conn.cursor()
-    cur.execute("DELETE FROM tracks WHERE album_id = ?", (album_id,))
-    cur.execute("DELETE FROM albums WHERE id = ?", (album_id,))
-    conn.commit()
-    cur.execute("INSERT INTO albums_fts(albums_fts) VALUES ('rebuild')")
-    conn.commit()
-    conn.close()
+def delete_album(album_id: int):
+    conn = get_write_db()
+    with write_lock, conn:
+        conn.execute("DELETE FROM albums WHERE id = ?", (album_id,))
+    invalidate_cache()
     return {"deleted": album_id}
 
 
@@ -501,64 +961,64 @@ async def delete_album(album_id: int):
 # ---------------------------------------------------------------------------
 
 @app.get("/api/tracks")
-async def list_tracks(
+def list_tracks(
     q: Optional[str] = Query(None),
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
+    include_total: bool = Query(False, description="Also count all matching tracks"),
 ):
-    conn = get_db()
-    cur = conn.cursor()
-
-    if q:
-        rows = cur.execute(
-            """SELECT t.*, a.title as album_title, a.genre
-               FROM tracks t JOIN albums a ON t.album_id = a.id
-               WHERE t.title LIKE ? OR t.artist LIKE ?
-               ORDER BY t.artist, t.title
-               LIMIT ? OFFSET ?""",
-            (f"%{q}%", f"%{q}%", limit, offset)
-        ).fetchall()
-        total = cur.execute(
-            "SELECT COUNT(*) FROM tracks t WHERE t.title LIKE ? OR t.artist LIKE ?",
-            (f"%{q}%", f"%{q}%")
-        ).fetchone()[0]
+    track_cols = ", ".join(f"t.{col}" for col in TRACK_LIST_COLS)
+    total = None
+    match = fts_query(q) if q else ""
+    if match:
+        # FTS search, best matches first
+        if include_total:
+            with read_db() as conn:
+                total = conn.execute(
+                    "SELECT COUNT(*) FROM tracks_fts WHERE tracks_fts MATCH ?", (match,)
+                ).fetchone()[0]
+        sql = f"""SELECT {track_cols}, a.title as album_title, a.genre
+                  FROM tracks_fts f
+                  JOIN tracks t ON t.id = f.rowid
+                  JOIN albums a ON t.album_id = a.id
+                  WHERE tracks_fts MATCH ?
+                  ORDER BY f.rank
+                  LIMIT ? OFFSET ?"""
+        params = [match, limit, offset]
     else:
-        rows = cur.execute(
-            """SELECT t.*, a.title as album_title, a.genre
-               FROM tracks t JOIN albums a ON t.album_id = a.id
-               ORDER BY t.artist, t.title
-               LIMIT ? OFFSET ?""",
-            (limit, offset)
-        ).fetchall()
-        total = cur.execute("SELECT COUNT(*) FROM tracks").fetchone()[0]
-
-    conn.close()
-    return {"items": [row_to_dict(r) for r in rows], "total": total}
+        if include_total:
+            with read_db() as conn:
+                total = conn.execute("SELECT COUNT(*) FROM tracks").fetchone()[0]
+        sql = f"""SELECT {track_cols}, a.title as album_title, a.genre
+                  FROM tracks t JOIN albums a ON t.album_id = a.id
+                  ORDER BY t.artist, t.title
+                  LIMIT ? OFFSET ?"""
+        params = [limit, offset]
+
+    return stream_items(sql, params, lambda last, count: {
+        "total": total,
+        "has_more": count == limit,
+    })
 
 
 @app.patch("/api/tracks/{track_id}")
-async def update_track(track_id: int, body: TrackUpdate):
-    conn = get_db()
-    cur = conn.cursor()
-
-    row = cur.execute("SELECT id FROM tracks WHERE id = ?", (track_id,)).fetchone()
-    if not row:
-        conn.close()
-        raise HTTPException(status_code=404, detail="Track not found")
-
+def update_track(track_id: int, body: TrackUpdate):
     updates = body.model_dump(exclude_none=True)
     if not updates:
-        conn.close()
         raise HTTPException(status_code=400, detail="No fields to update")
 
+    conn = get_write_db()
     set_clause = ", ".join(f"{k} = ?" for k in updates)
-    cur.execute(
-        f"UPDATE tracks SET {set_clause} WHERE id = ?",
-        list(updates.values()) + [track_id]
-    )
-    conn.commit()
-    result = cur.execute("SELECT * FROM tracks WHERE id = ?", (track_id,)).fetchone()
-    conn.close()
+    with write_lock:
+        with conn:
+            cur = conn.execute(
+                f"UPDATE tracks SET {set_clause} WHERE id = ?",
+                list(updates.values()) + [track_id]
+            )
+            if not cur.rowcount:
+                raise HTTPException(status_code=404, detail="Track not found")
+        # Read back through the writer so the response reflects this commit
+        result = conn.execute("SELECT * FROM tracks WHERE id = ?", (track_id,)).fetchone()
     return row_to_dict(result)
 
 
@@ -567,35 +1027,38 @@ async def update_track(track_id: int, body: TrackUpdate):
 # ---------------------------------------------------------------------------
 
 @app.get("/api/genres")
-async def list_genres():
-    conn = get_db()
-    rows = conn.execute(
-        "SELECT genre, COUNT(*) as count FROM albums GROUP BY genre ORDER BY count DESC"
-    ).fetchall()
-    conn.close()
-    return [dict(r) for r in rows]
+def list_genres(request: Request):
+    def compute():
+        with read_db() as conn:
+            rows = conn.execute(
+                "SELECT genre, COUNT(*) as count FROM albums GROUP BY genre ORDER BY count DESC"
+            ).fetchall()
+        return [dict(r) for r in rows]
+    return cached_response(request, "genres", compute)
 
 
 @app.get("/api/artists")
-async def list_artists():
-    conn = get_db()
-    rows = conn.execute(
-        """SELECT a.name, a.id, COUNT(al.id) as album_count
-           FROM artists a JOIN albums al ON a.id = al.artist_id
-           GROUP BY a.id ORDER BY album_count DESC, a.name ASC"""
-    ).fetchall()
-    conn.close()
-    return [dict(r) for r in rows]
+def list_artists(request: Request):
+    def compute():
+        with read_db() as conn:
+            rows = conn.execute(
+                """SELECT name, id, album_count FROM artists
+                   WHERE album_count > 0
+                   ORDER BY album_count DESC, name ASC"""
+            ).fetchall()
+        return [dict(r) for r in rows]
+    return cached_response(request, "artists", compute)
 
 
 @app.get("/api/formats")
-async def list_formats():
-    conn = get_db()
-    rows = conn.execute(
-        "SELECT format, COUNT(*) as count FROM albums GROUP BY format ORDER BY count DESC"
-    ).fetchall()
-    conn.close()
-    return [dict(r) for r in rows]
+def list_formats(request: Request):
+    def compute():
+        with read_db() as conn:
+            rows = conn.execute(
+                "SELECT format, COUNT(*) as count FROM albums GROUP BY format ORDER BY count DESC"
+            ).fetchall()
+        return [dict(r) for r in rows]
+    return cached_response(request, "formats", compute)
 
 
 # ---------------------------------------------------------------------------